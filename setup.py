@@ -34,6 +34,10 @@ setup(
     python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
+        "chroma": [
+            "llama-index-vector-stores-chroma",
+            "chromadb",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -6,8 +6,18 @@ into explainable, testable shell scripts, and for querying system information
 using natural language.
 """
 
-from .ask import SystemQueryEngine
-from .collect_info import SystemInfoCollector
-
 __version__ = "0.1.0"
 __all__ = ["SystemInfoCollector", "SystemQueryEngine"]
+
+
+def __getattr__(name: str):
+    """Import the public classes on first access to keep ``import shellai`` cheap."""
+    if name == "SystemQueryEngine":
+        from .ask import SystemQueryEngine
+
+        return SystemQueryEngine
+    if name == "SystemInfoCollector":
+        from .collect_info import SystemInfoCollector
+
+        return SystemInfoCollector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
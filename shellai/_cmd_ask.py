@@ -0,0 +1,44 @@
+"""
+The ``shellai ask`` command.
+"""
+
+import sys
+
+import click
+
+
+@click.command(name="ask")
+@click.option(
+    "--system-info-dir",
+    help="Directory containing system info files (overrides config)",
+)
+@click.option("--model", help="Ollama model to use (overrides config)")
+@click.option("--question", help="Single question to ask (non-interactive mode)")
+@click.option("--refresh", is_flag=True, help="Refresh the index before querying")
+@click.pass_context
+def cmd(ctx: click.Context, system_info_dir: str, model: str, question: str, refresh: bool):
+    """Ask natural language questions about your system."""
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+
+    # Imported here so other commands don't pay the LlamaIndex import cost
+    from .ask import SystemQueryEngine
+
+    engine = SystemQueryEngine(
+        system_info_dir=system_info_dir, model=model, config_path=config_path
+    )
+
+    if not engine.initialize():
+        sys.exit(1)
+
+    # Refresh index if requested
+    if refresh:
+        if not engine.refresh_index():
+            click.echo("❌ Failed to refresh index.")
+            sys.exit(1)
+
+    if question:
+        # Single question mode, the answer is streamed as it is generated
+        engine.query(question)
+    else:
+        # Interactive mode
+        engine.interactive_session()
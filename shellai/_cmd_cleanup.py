@@ -0,0 +1,67 @@
+"""
+The ``shellai cleanup`` command.
+"""
+
+from pathlib import Path
+
+import click
+
+
+@click.command(name="cleanup")
+@click.option(
+    "--system-info-dir",
+    help="Directory containing system info files (overrides config)",
+)
+@click.option("--force", is_flag=True, help="Force cleanup without confirmation")
+@click.pass_context
+def cmd(ctx: click.Context, system_info_dir: str, force: bool):
+    """Clean up text files after successful indexing (optional optimization)."""
+    from ._fs import scan_files
+    from .config import get_config
+
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+    cfg = get_config(config_path)
+
+    # Use config default if not specified
+    system_info_dir = system_info_dir or cfg.system_info_dir
+    system_path = Path(system_info_dir)
+    storage_path = system_path / cfg.storage_dir
+
+    # Check if index exists
+    if not storage_path.exists():
+        click.echo(
+            "❌ No LlamaIndex storage found. Run 'shellai collect' and 'shellai refresh' first."
+        )
+        return
+
+    # Check for text files
+    text_files = scan_files(system_path, ".txt")
+    if not text_files:
+        click.echo("✅ No text files found - already cleaned up!")
+        return
+
+    click.echo(f"📁 Found {len(text_files)} text files in {system_path}")
+    click.echo("💾 LlamaIndex storage exists and contains all document data")
+    click.echo("\n📄 Text files that can be removed:")
+    for name, size in text_files:
+        click.echo(f"  • {name} ({size} bytes)")
+
+    if not force:
+        click.echo("\n⚠️  Important:")
+        click.echo("   • Text files are only needed for initial indexing")
+        click.echo("   • All document content is preserved in LlamaIndex storage")
+        click.echo("   • You can always re-collect system info if needed")
+
+        if not click.confirm("Remove text files to save space?"):
+            click.echo("Cancelled.")
+            return
+
+    # Remove text files
+    removed_size = 0
+    for name, size in text_files:
+        (system_path / name).unlink()
+        removed_size += size
+
+    click.echo(f"✅ Removed {len(text_files)} text files")
+    click.echo(f"💾 Freed {removed_size:,} bytes of disk space")
+    click.echo("🔍 Query functionality preserved in LlamaIndex storage")
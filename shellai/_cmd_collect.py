@@ -0,0 +1,62 @@
+"""
+The ``shellai collect`` command.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+
+@click.command(name="collect")
+@click.option(
+    "--output-dir",
+    help="Directory to save system information files (overrides config)",
+)
+@click.option("--custom-command", multiple=True, help="Add custom command as 'name:command'")
+@click.option(
+    "--max-age-seconds",
+    type=click.FloatRange(min=0),
+    default=0,
+    show_default=True,
+    help="Keep files collected less than this many seconds ago (0 always collects)",
+)
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    output_dir: str,
+    custom_command: tuple[str, ...],
+    max_age_seconds: float,
+):
+    """Collect system information for querying."""
+    from .collect_info import SystemInfoCollector
+
+    # Only read the config file when it has to provide the default
+    if not output_dir:
+        from .config import get_config
+
+        config_path = ctx.obj.get("config_path") if ctx.obj else None
+        output_dir = get_config(config_path).system_info_dir
+
+    collector = SystemInfoCollector(output_dir)
+
+    # Collect standard system info
+    results = collector.collect_all(min_age_seconds=max_age_seconds)
+
+    # Collect custom commands
+    for entry in custom_command:
+        if ":" not in entry:
+            click.echo(f"❌ Invalid custom command format: {entry}")
+            click.echo("Use format: name:command")
+            continue
+
+        name, command = entry.split(":", 1)
+        collector.collect_custom(name.strip(), command.strip())
+
+    successful = sum(results.values())
+    total = len(results)
+
+    click.echo("\n✅ Collection complete!")
+    click.echo(f"📊 Successfully collected {successful}/{total} items")
+    click.echo(f"📁 Files saved to: {Path(output_dir).absolute()}")
@@ -0,0 +1,80 @@
+"""
+The ``shellai config`` command.
+"""
+
+from __future__ import annotations
+
+import math
+
+import click
+
+
+@click.command(name="config")
+@click.option("--show", is_flag=True, help="Show current configuration")
+@click.option("--reset", is_flag=True, help="Reset to default configuration")
+@click.option("--set", "settings", multiple=True, help="Set config value (key=value)")
+@click.pass_context
+def cmd(ctx: click.Context, show: bool, reset: bool, settings: tuple[str, ...]):
+    """Manage ShellAI configuration."""
+    from .config import get_config
+
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+    cfg = get_config(config_path)
+
+    if reset:
+        if cfg.config_path.exists():
+            cfg.config_path.unlink()
+            click.echo(f"🗑️ Deleted config file: {cfg.config_path}")
+        # Reload first so the written file holds the defaults, not the values just deleted
+        cfg.reload()
+        cfg.create_default_config()
+        click.echo("✅ Configuration reset to defaults")
+        return
+
+    if settings:
+        for setting in settings:
+            if "=" not in setting:
+                click.echo(f"❌ Invalid setting format: {setting}")
+                click.echo("Use format: key=value (e.g., ollama.default_model=gemma2:2b)")
+                continue
+
+            key, value = setting.split("=", 1)
+            # Try to convert value to appropriate type
+            lowered = value.lower()
+            if lowered in ("true", "false"):
+                value = lowered == "true"
+            else:
+                try:
+                    value = int(value)
+                except ValueError:
+                    try:
+                        number = float(value)
+                    except ValueError:
+                        pass
+                    else:
+                        # Keep words like "nan" or "inf" as strings
+                        if math.isfinite(number):
+                            value = number
+
+            cfg.set(key, value)
+            click.echo(f"✅ Set {key} = {value}")
+
+        if cfg.save():
+            click.echo("💾 Configuration saved")
+        else:
+            click.echo("❌ Failed to save configuration")
+        return
+
+    if show or not (reset or settings):
+        if cfg.using_defaults:
+            click.echo(f"📁 Config file: {cfg.config_path} (not created yet, using defaults)")
+        else:
+            click.echo(f"📁 Config file: {cfg.config_path}")
+        click.echo("\n🔧 Current configuration:")
+        click.echo(f"  Ollama URL: {cfg.ollama_base_url}")
+        click.echo(f"  Default model: {cfg.default_model}")
+        click.echo(f"  Request timeout: {cfg.get('ollama.request_timeout', 60.0)}s")
+        click.echo(f"  Embedding model: {cfg.embedding_model}")
+        click.echo(f"  Embedding batch size: {cfg.get('embedding.batch_size', 64)}")
+        click.echo(f"  System info dir: {cfg.system_info_dir}")
+        click.echo(f"  Storage dir: {cfg.storage_dir}")
@@ -0,0 +1,35 @@
+"""
+The ``shellai refresh`` command.
+"""
+
+import sys
+
+import click
+
+
+@click.command(name="refresh")
+@click.option(
+    "--system-info-dir",
+    help="Directory containing system info files (overrides config)",
+)
+@click.option("--model", help="Ollama model to use (overrides config)")
+@click.pass_context
+def cmd(ctx: click.Context, system_info_dir: str, model: str):
+    """Refresh the LlamaIndex vector store with updated system information."""
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+
+    # Imported here so other commands don't pay the LlamaIndex import cost
+    from .ask import SystemQueryEngine
+
+    engine = SystemQueryEngine(
+        system_info_dir=system_info_dir, model=model, config_path=config_path
+    )
+
+    if not engine.initialize():
+        sys.exit(1)
+
+    if engine.refresh_index():
+        click.echo("✅ Index refreshed successfully!")
+    else:
+        click.echo("❌ Failed to refresh index.")
+        sys.exit(1)
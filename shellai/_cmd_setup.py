@@ -0,0 +1,62 @@
+"""
+The ``shellai setup`` command.
+"""
+
+import sys
+
+import click
+
+
+@click.command(name="setup")
+@click.pass_context
+def cmd(ctx: click.Context):
+    """Check and setup requirements for ShellAI."""
+    click.echo("🔍 Checking ShellAI setup...")
+
+    # Check Python version
+    if sys.version_info < (3, 10):
+        click.echo("❌ Python 3.10+ required")
+        return
+    else:
+        click.echo(f"✅ Python {sys.version.split()[0]}")
+
+    # Check LlamaIndex without paying for importing it
+    from importlib.util import find_spec
+
+    if find_spec("llama_index") and find_spec("llama_index.core"):
+        click.echo("✅ LlamaIndex installed")
+    else:
+        click.echo("❌ LlamaIndex not installed")
+        click.echo("Run: pip install llama-index llama-index-llms-ollama")
+        return
+
+    # Check if the Ollama server is available by asking it for its models
+    import json
+    import urllib.request
+
+    from .config import get_config
+
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+    base_url = get_config(config_path).ollama_base_url.rstrip("/")
+
+    try:
+        with urllib.request.urlopen(f"{base_url}/api/tags", timeout=2) as response:
+            models = [model["name"] for model in json.load(response).get("models", [])]
+    except (OSError, ValueError, KeyError) as e:
+        # URLError and timeouts are OSErrors, bad responses raise ValueError/KeyError
+        click.echo(f"❌ Ollama not reachable at {base_url} ({e})")
+        click.echo("Install from: https://ollama.ai and start it with: ollama serve")
+    else:
+        click.echo("✅ Ollama is available")
+        if models:
+            click.echo(f"📦 Available models: {', '.join(models)}")
+        else:
+            click.echo("⚠️  No models installed")
+            click.echo("Try: ollama pull mistral")
+
+    click.echo("\n🎯 Setup complete! Try:")
+    click.echo("  shellai collect    # Collect system info")
+    click.echo("  shellai ask        # Ask questions about your system")
+    click.echo("  shellai refresh    # Refresh the vector index")
+    click.echo("  shellai status     # Check collected info status")
+    click.echo("  shellai config     # Manage configuration")
@@ -0,0 +1,64 @@
+"""
+The ``shellai status`` command.
+"""
+
+from pathlib import Path
+
+import click
+
+
+@click.command(name="status")
+@click.option(
+    "--system-info-dir",
+    help="Directory containing system info files (overrides config)",
+)
+@click.pass_context
+def cmd(ctx: click.Context, system_info_dir: str):
+    """Show status of collected system information."""
+    from ._fs import scan_files
+    from .config import get_config
+
+    config_path = ctx.obj.get("config_path") if ctx.obj else None
+    cfg = get_config(config_path)
+
+    # Use config default if not specified
+    system_info_dir = system_info_dir or cfg.system_info_dir
+    info_dir = Path(system_info_dir)
+
+    if not info_dir.exists():
+        click.echo(f"❌ Directory '{system_info_dir}' does not exist.")
+        click.echo("Run 'shellai collect' first.")
+        return
+
+    # Check text files
+    text_files = scan_files(info_dir, ".txt")
+
+    # Check LlamaIndex storage
+    storage_dir = info_dir / cfg.storage_dir
+    has_storage = storage_dir.exists()
+
+    click.echo(f"📁 System info directory: {info_dir.absolute()}")
+
+    if text_files:
+        total_size = sum(size for _, size in text_files)
+        click.echo(f"📄 Text files: {len(text_files)} files ({total_size:,} bytes)")
+        for name, size in text_files:
+            click.echo(f"  • {name} ({size} bytes)")
+    else:
+        click.echo("📄 Text files: None (cleaned up)")
+
+    if has_storage:
+        storage_size = sum(
+            size for suffix in (".json", ".sqlite") for _, size in scan_files(storage_dir, suffix)
+        )
+        click.echo(f"💾 LlamaIndex storage: ✅ ({storage_size:,} bytes)")
+        click.echo("🔍 Ready for queries!")
+
+        if text_files:
+            click.echo("\n💡 Tip: Run 'shellai cleanup' to remove redundant text files")
+    else:
+        click.echo("💾 LlamaIndex storage: ❌ Missing")
+        if text_files:
+            click.echo("Run 'shellai refresh' to create index from text files")
+        else:
+            click.echo("Run 'shellai collect' first to gather system data")
@@ -0,0 +1,22 @@
+"""
+Filesystem helpers shared by the CLI commands.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+
+def scan_files(dir_path: Path, suffix: str) -> List[Tuple[str, int]]:
+    """List ``(name, size)`` of the files in a directory ending with a suffix, sorted by name.
+
+    Uses a single ``os.scandir`` pass so each file costs one ``stat`` call.
+    """
+    with os.scandir(dir_path) as it:
+        entries = [
+            (entry.name, entry.stat().st_size)
+            for entry in it
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+    entries.sort()
+    return entries
@@ -5,28 +5,122 @@ This module provides an interactive way to ask questions about your system
 using natural language, powered by LlamaIndex and Ollama.
 """
 
+from __future__ import annotations
+
+import os
 import sys
+import json
+import queue
 import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
-
-from llama_index.core.embeddings import resolve_embed_model  # type: ignore
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from .config import get_config
-
-try:
-    from llama_index.core import (
-        Settings,
-        SimpleDirectoryReader,
-        StorageContext,
-        VectorStoreIndex,
-        load_index_from_storage,  # type: ignore
+from .embed_cache import EmbeddingCache, text_hash
+
+# LlamaIndex takes seconds to import, so it is only loaded once a query engine is initialized
+if TYPE_CHECKING:
+    from llama_index.core import Document, VectorStoreIndex
+    from llama_index.core.schema import BaseNode
+
+MANIFEST_FILE = "manifest.json"
+CHROMA_DIR = "chroma"
+CHROMA_COLLECTION = "shellai"
+ANSWER_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=None)
+def _get_embed_model(
+    name: str, batch_size: int, ollama_base_url: str, request_timeout: float, cache_dir: str
+) -> Any:
+    """Resolve an embedding model once per process and reuse it afterwards.
+
+    cache_dir is where FastEmbed keeps downloaded models (it ignores HF_HOME).
+    """
+    from llama_index.core.embeddings import resolve_embed_model  # type: ignore
+
+    if name.startswith("ollama:"):
+        from .embeddings import OllamaBatchEmbedding
+
+        embed_model = OllamaBatchEmbedding(
+            model_name=name.split(":", 1)[1],
+            base_url=ollama_base_url,
+            request_timeout=request_timeout,
+        )
+    elif name.startswith("fastembed:"):
+        model_name = name.split(":", 1)[1]
+        try:
+            # Quantized ONNX build: smaller and faster on CPU than the PyTorch model
+            from llama_index.embeddings.fastembed import FastEmbedEmbedding  # type: ignore
+
+            embed_model = FastEmbedEmbedding(model_name=model_name, cache_dir=cache_dir)
+        except ImportError:
+            print("⚠️ FastEmbed not installed, falling back to the PyTorch embedding model")
+            print("Run: pip install llama-index-embeddings-fastembed")
+            embed_model = resolve_embed_model(f"local:{model_name}")
+    else:
+        embed_model = resolve_embed_model(name)
+    # Embed many chunks per forward pass instead of the default of 10
+    embed_model.embed_batch_size = batch_size
+    return embed_model
+
+
+@lru_cache(maxsize=None)
+def _get_ollama_client(base_url: str, timeout: float) -> Any:
+    """Share one keep-alive HTTP connection pool per Ollama server."""
+    import httpx
+    from ollama import Client
+
+    return Client(
+        host=base_url,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=4),
     )
-    from llama_index.llms.ollama import Ollama
-except ImportError:
-    print("❌ Error: LlamaIndex dependencies not installed.")
-    print("Run: pip install llama-index llama-index-llms-ollama")
-    sys.exit(1)
+
+
+def _module_available(name: str) -> bool:
+    """Check whether a (dotted) module can be imported without importing it."""
+    try:
+        return find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _get_node_parser(chunk_size: int, chunk_overlap: int) -> Any:
+    """Build the sentence splitter (and load its tokenizer) once per process."""
+    from llama_index.core.node_parser import SentenceSplitter
+
+    return SentenceSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def _hash_file(path: Path) -> str:
+    """Return the hash of a file's text, decoded the way SimpleDirectoryReader decodes it.
+
+    This equals text_hash() of the loaded document, so indexed content and files compare.
+    """
+    return text_hash(path.read_bytes().decode("utf-8", errors="ignore"))
+
+
+def _split_document(args: Tuple[Document, int, int]) -> List[BaseNode]:
+    """Split one document into nodes (runs in worker processes)."""
+    document, chunk_size, chunk_overlap = args
+    node_parser = _get_node_parser(chunk_size, chunk_overlap)
+    return node_parser.get_nodes_from_documents([document], show_progress=False)
+
+
+def _parallel_map(
+    func: Callable[[Any], Any], items: List[Any], workers: Optional[int]
+) -> List[Any]:
+    """Map func over items, across worker processes when a worker count is given."""
+    if not workers or len(items) < 2:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=max(1, len(items) // (workers * 4))))
 
 
 class SystemQueryEngine:
@@ -59,17 +153,44 @@ class SystemQueryEngine:
 
     def initialize(self) -> bool:
         """Initialize the LLM and create or load the index."""
+        try:
+            from llama_index.core import (
+                Settings,
+                VectorStoreIndex,
+                load_index_from_storage,  # type: ignore
+            )
+            from llama_index.llms.ollama import Ollama
+        except ImportError:
+            print("❌ Error: LlamaIndex dependencies not installed.")
+            print("Run: pip install llama-index llama-index-llms-ollama")
+            sys.exit(1)
+
         try:
             print(f"🤖 Initializing with model: {self.model}")
 
+            # Keep downloaded model snapshots next to the index so later runs reuse them
+            os.environ.setdefault("HF_HOME", str(self.storage_dir / "hf_cache"))
+
             # Configure embedding model from config
-            Settings.embed_model = resolve_embed_model(self.config.embedding_model)
+            request_timeout = self.config.get("ollama.request_timeout", 60.0)
+            Settings.embed_model = _get_embed_model(
+                self.config.embedding_model,
+                self.config.get("embedding.batch_size", 64),
+                self.config.ollama_base_url,
+                request_timeout,
+                # FastEmbed defaults to the temp dir, which is wiped on reboot
+                str(Path(os.environ["HF_HOME"]) / "fastembed"),
+            )
+            Settings.node_parser = self._node_parser()
 
             # Initialize Ollama LLM with config settings
             llm = Ollama(
                 model=self.model,
                 base_url=self.config.ollama_base_url,
-                request_timeout=self.config.get("ollama.request_timeout", 60.0),
+                request_timeout=request_timeout,
+                client=_get_ollama_client(self.config.ollama_base_url, request_timeout),
+                # Keep the model (and its prompt cache) loaded between queries
+                keep_alive=self.config.get("ollama.keep_alive", "30m"),
             )
             Settings.llm = llm
 
@@ -77,14 +198,15 @@ class SystemQueryEngine:
             if self._storage_exists():
                 print("📚 Loading existing index from storage...")
                 try:
-                    storage_context = StorageContext.from_defaults(
-                        persist_dir=str(self.storage_dir)
-                    )
+                    backend = self._load_manifest().get("vector_store", "simple")
+                    storage_context = self._storage_context(backend, load=True)
                     # Load index and cast to VectorStoreIndex
                     loaded_index = load_index_from_storage(storage_context)
                     if isinstance(loaded_index, VectorStoreIndex):
                         self.index = loaded_index
                         print("✅ Index loaded from storage!")
+                        # Bring it in line with the current text files, re-embedding only changes
+                        self._update_index()
                     else:
                         print("⚠️ Loaded index is not a VectorStoreIndex, creating new one...")
                         self.index = self._create_new_index()
@@ -100,7 +222,7 @@ class SystemQueryEngine:
                 return False
 
             # Create query engine
-            self.query_engine = self.index.as_query_engine(llm=llm)
+            self.query_engine = self._create_query_engine(llm)
 
             print("✅ Query engine initialized successfully!")
             return True
@@ -111,13 +233,154 @@ class SystemQueryEngine:
             print(f"Try: ollama pull {self.model}")
             return False
 
+    def _create_query_engine(self, llm: Any) -> Any:
+        """Create a query engine that streams the answer as it is generated."""
+        return self.index.as_query_engine(llm=llm, streaming=True)
+
     def _storage_exists(self) -> bool:
         """Check if persistent storage exists and is valid."""
-        required_files = ["index_store.json", "docstore.json", "vector_store.json"]
-        return all((self.storage_dir / file).exists() for file in required_files)
+        required_files = ["index_store.json", "docstore.json"]
+        if not all((self.storage_dir / file).exists() for file in required_files):
+            return False
+        if self._load_manifest().get("vector_store") == "chroma":
+            if not (self.storage_dir / CHROMA_DIR).is_dir():
+                return False
+        else:
+            # Newer LlamaIndex releases namespace the vector store file
+            vector_stores = ["vector_store.json", "default__vector_store.json"]
+            if not any((self.storage_dir / file).exists() for file in vector_stores):
+                return False
+        if self._index_outdated():
+            print("🔄 Index settings changed since the index was built")
+            return False
+        return True
+
+    def _vector_store_backend(self, file_count: int) -> str:
+        """Choose the vector store for a new index: 'simple' (JSON) or 'chroma'."""
+        backend = self.config.get("index.vector_store", "auto")
+        if backend == "auto":
+            threshold = self.config.get("index.chroma_threshold", 200)
+            backend = "chroma" if file_count >= threshold else "simple"
+
+        if backend == "chroma" and not _module_available("llama_index.vector_stores.chroma"):
+            print("⚠️ Chroma vector store not installed, using the default JSON store")
+            print("Run: pip install llama-index-vector-stores-chroma")
+            return "simple"
+        return backend
+
+    def _storage_context(self, backend: str, load: bool = False) -> Any:
+        """Create a storage context for the given vector store backend.
+
+        With load=False a fresh, empty vector store is prepared for a full rebuild.
+        """
+        from llama_index.core import StorageContext
+
+        kwargs: Dict[str, Any] = {}
+        if backend == "chroma":
+            import chromadb  # type: ignore
+            from llama_index.vector_stores.chroma import ChromaVectorStore  # type: ignore
+
+            client = chromadb.PersistentClient(path=str(self.storage_dir / CHROMA_DIR))
+            if not load and CHROMA_COLLECTION in [c.name for c in client.list_collections()]:
+                client.delete_collection(CHROMA_COLLECTION)
+            collection = client.get_or_create_collection(CHROMA_COLLECTION)
+            kwargs["vector_store"] = ChromaVectorStore(chroma_collection=collection)
+
+        if load:
+            return StorageContext.from_defaults(persist_dir=str(self.storage_dir), **kwargs)
+        return StorageContext.from_defaults(**kwargs)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the manifest describing the files the index was built from."""
+        try:
+            with open(self.storage_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _scan_sources(self, manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Describe the current text files, only hashing those whose mtime or size changed."""
+        known = manifest.get("files", {})
+        sources: Dict[str, Dict[str, Any]] = {}
+
+        to_hash: List[Path] = []
+        for path in sorted(self.system_info_dir.glob("*.txt")):
+            stat = path.stat()
+            entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+            previous = known.get(path.name)
+            if previous and all(previous.get(key) == entry[key] for key in ("mtime", "size")):
+                entry["sha256"] = previous["sha256"]
+            else:
+                to_hash.append(path)
+            sources[path.name] = entry
+
+        digests = _parallel_map(_hash_file, to_hash, self._num_workers(len(to_hash)))
+        for path, digest in zip(to_hash, digests):
+            sources[path.name]["sha256"] = digest
+
+        return sources
+
+    def _index_outdated(self) -> bool:
+        """Check whether the persisted index was built with settings that no longer apply.
+
+        Changed text files don't make it outdated; _update_index re-embeds just those.
+        """
+        file_count = len(list(self.system_info_dir.glob("*.txt")))
+        if not file_count:
+            # Text files are optional once indexed (see 'shellai cleanup'), so keep the index
+            return False
+
+        manifest = self._load_manifest()
+        if manifest.get("embedding_model") != self.config.embedding_model:
+            return True
+        # Chunking changes affect every file, not just the changed ones
+        chunk_size, chunk_overlap = self._chunking()
+        if (manifest.get("chunk_size"), manifest.get("chunk_overlap")) != (
+            chunk_size,
+            chunk_overlap,
+        ):
+            return True
+        return manifest.get("vector_store", "simple") != self._vector_store_backend(file_count)
+
+    def _save_manifest(
+        self, vector_store: str, indexed: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """Record the text files the persisted index was built from.
+
+        indexed describes files embedded just now; other files keep their chunk hashes.
+        """
+        previous = self._load_manifest()
+        files = self._scan_sources(previous)
+        known = previous.get("files", {})
+        for name, entry in files.items():
+            if indexed and name in indexed:
+                on_disk = entry["sha256"]
+                # Record the content that was indexed, not what the file holds by now
+                entry.update(indexed[name])
+                if entry["sha256"] != on_disk:
+                    # Rewritten after loading; a cleared mtime forces a rehash next time
+                    entry["mtime"] = None
+            elif "chunks" in known.get(name, {}):
+                entry["chunks"] = known[name]["chunks"]
+
+        chunk_size, chunk_overlap = self._chunking()
+        manifest = {
+            "embedding_model": self.config.embedding_model,
+            "chunk_size": chunk_size,
+            "chunk_overlap": chunk_overlap,
+            "vector_store": vector_store,
+            "files": files,
+        }
+        with open(self.storage_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        # Cache rows of text that changed or went away would otherwise pile up forever
+        self._prune_cache(files)
 
     def _create_new_index(self) -> Optional[VectorStoreIndex]:
         """Create a new vector index from system information documents."""
+        from llama_index.core import VectorStoreIndex
+
         # Load system information documents
         print("📄 Loading system information documents...")
 
@@ -128,11 +391,7 @@ class SystemQueryEngine:
             print("💡 Run 'shellai collect' first to gather system data.")
             return None
 
-        documents = SimpleDirectoryReader(
-            str(self.system_info_dir),
-            recursive=False,  # Don't include storage directory
-            exclude=["storage"],
-        ).load_data()
+        documents = self._load_documents()
 
         if not documents:
             print("❌ No system information files found.")
@@ -140,31 +399,231 @@ class SystemQueryEngine:
 
         print(f"📄 Loaded {len(documents)} system info files")
 
-        # Create vector index
+        # Create vector index from pre-embedded nodes
         print("🔍 Creating search index...")
-        index = VectorStoreIndex.from_documents(documents)
+        nodes = self._parse_nodes(documents)
+        chunk_hashes = self._embed_nodes(nodes)
+        backend = self._vector_store_backend(len(text_files))
+        index = VectorStoreIndex(
+            nodes,
+            storage_context=self._storage_context(backend),
+            insert_batch_size=self.config.get("index.insert_batch_size", 2048),
+        )
 
         # Persist the index
         print("💾 Saving index to storage...")
         index.storage_context.persist(persist_dir=str(self.storage_dir))
+        self._save_manifest(backend, self._indexed_files(documents, nodes, chunk_hashes))
 
         print("✅ Index created and persisted to storage")
         print("💡 Text files are now optional - all data is stored in the index")
 
         return index
 
+    def _load_documents(self, files: Optional[List[Path]] = None) -> List[Document]:
+        """Load system info documents, keyed by file name so they can be replaced later."""
+        from llama_index.core import SimpleDirectoryReader
+
+        if files is None:
+            reader = SimpleDirectoryReader(
+                str(self.system_info_dir),
+                recursive=False,  # Don't include storage directory
+                exclude=["storage"],
+                # Only the text files the manifest tracks, so updates can replace or drop them
+                required_exts=[".txt"],
+            )
+        else:
+            # Absolute paths keep file_path metadata (and so cache keys) identical to full builds
+            reader = SimpleDirectoryReader(input_files=[str(file.absolute()) for file in files])
+
+        documents = reader.load_data(num_workers=self._num_workers(len(reader.input_files)))
+        for document in documents:
+            document.id_ = document.metadata["file_name"]
+        return documents
+
+    def _num_workers(self, item_count: int) -> Optional[int]:
+        """Pick a worker count for parallel ingestion, or None to stay in-process."""
+        # Spawning workers costs more than it saves on a handful of small files
+        if item_count < self.config.get("ingest.parallel_threshold", 32):
+            return None
+        return self.config.get("ingest.num_workers") or min(8, os.cpu_count() or 2)
+
+    def _update_index(self) -> bool:
+        """Re-embed only added or changed files in the loaded index.
+
+        Returns False when the index was already up to date.
+        """
+        manifest = self._load_manifest()
+        sources = self._scan_sources(manifest)
+        if not sources:
+            # Nothing to compare against after 'shellai cleanup'; keep the index as is
+            return False
+
+        known = manifest.get("files", {})
+        changed = [
+            name
+            for name, entry in sources.items()
+            if known.get(name, {}).get("sha256") != entry["sha256"]
+        ]
+        removed = [name for name in known if name not in sources]
+        if not changed and not removed:
+            return False
+
+        print(f"🔄 Updating index: {len(changed)} changed, {len(removed)} removed files")
+        for name in changed + removed:
+            self.index.delete_ref_doc(name, delete_from_docstore=True)
+
+        indexed: Dict[str, Dict[str, Any]] = {}
+        if changed:
+            documents = self._load_documents([self.system_info_dir / name for name in changed])
+            nodes = self._parse_nodes(documents)
+            indexed = self._indexed_files(documents, nodes, self._embed_nodes(nodes))
+            self.index.insert_nodes(nodes)
+
+        self.index.storage_context.persist(persist_dir=str(self.storage_dir))
+        self._save_manifest(manifest.get("vector_store", "simple"), indexed)
+        return True
+
+    def _chunking(self) -> Tuple[int, int]:
+        """Get the configured chunk size and overlap."""
+        return (
+            self.config.get("index.chunk_size", 1024),
+            self.config.get("index.chunk_overlap", 50),
+        )
+
+    def _node_parser(self) -> Any:
+        """Get the shared sentence splitter for the configured chunking."""
+        return _get_node_parser(*self._chunking())
+
+    def _parse_nodes(self, documents: List[Document]) -> List[BaseNode]:
+        """Split documents into chunks once, ready to be embedded in a single batch.
+
+        Chunk texts are cached by document hash, so unchanged documents skip splitting.
+        """
+        from llama_index.core.node_parser.node_utils import build_nodes_from_splits
+        from llama_index.core.schema import MetadataMode
+
+        chunk_size, chunk_overlap = self._chunking()
+        node_parser = self._node_parser()
+        hashes = [text_hash(document.text) for document in documents]
+
+        with EmbeddingCache(self.storage_dir / "embeddings.sqlite") as cache:
+            cached = cache.get_splits(chunk_size, chunk_overlap, hashes)
+
+            misses = [doc for doc, digest in zip(documents, hashes) if digest not in cached]
+            parsed = iter(
+                _parallel_map(
+                    _split_document,
+                    [(document, chunk_size, chunk_overlap) for document in misses],
+                    self._num_workers(len(misses)),
+                )
+            )
+
+            nodes: List[BaseNode] = []
+            fresh: Dict[str, List[str]] = {}
+            for document, digest in zip(documents, hashes):
+                if digest in cached:
+                    # Rebuild nodes exactly as the splitter would, minus the splitting
+                    document_nodes = node_parser._postprocess_parsed_nodes(
+                        build_nodes_from_splits(cached[digest], document),
+                        {document.id_: document},
+                    )
+                else:
+                    document_nodes = next(parsed)
+                    fresh[digest] = [
+                        node.get_content(metadata_mode=MetadataMode.NONE) for node in document_nodes
+                    ]
+                nodes.extend(document_nodes)
+
+            cache.put_splits(chunk_size, chunk_overlap, fresh.items())
+
+        return nodes
+
+    def _embed_nodes(self, nodes: List[BaseNode]) -> List[str]:
+        """Attach embeddings to nodes, only running the model for uncached texts.
+
+        Returns the cache hash of each node's embedded text.
+        """
+        from llama_index.core import Settings
+        from llama_index.core.schema import MetadataMode
+
+        embed_model = Settings.embed_model
+        model = self._embedding_cache_key()
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        hashes = [text_hash(text) for text in texts]
+
+        with EmbeddingCache(self.storage_dir / "embeddings.sqlite") as cache:
+            vectors = cache.get_many(model, hashes)
+
+            missing = {digest: text for digest, text in zip(hashes, texts) if digest not in vectors}
+            if missing:
+                print(f"🧮 Embedding {len(missing)} new chunks ({len(vectors)} cached)...")
+                # Embed similar-length texts together so batches carry less padding
+                ordered = sorted(missing, key=lambda digest: len(missing[digest]))
+                new_vectors = embed_model.get_text_embedding_batch(
+                    [missing[digest] for digest in ordered], show_progress=True
+                )
+                fresh = dict(zip(ordered, new_vectors))
+                cache.put_many(model, fresh.items())
+                vectors.update(fresh)
+            else:
+                print(f"♻️ Reusing {len(vectors)} cached embeddings")
+
+        for node, digest in zip(nodes, hashes):
+            node.embedding = vectors[digest]
+        return hashes
+
+    def _embedding_cache_key(self) -> str:
+        """Get the embedding cache key for the loaded embedding model."""
+        from llama_index.core import Settings
+
+        # Key on the model actually loaded, which may be a fallback for the configured one
+        embed_model = Settings.embed_model
+        return f"{embed_model.class_name()}:{embed_model.model_name}"
+
+    def _indexed_files(
+        self, documents: List[Document], nodes: List[BaseNode], chunk_hashes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Record each freshly indexed file's content hash and embedded chunk hashes."""
+        indexed: Dict[str, Dict[str, Any]] = {
+            document.id_: {"sha256": text_hash(document.text), "chunks": []}
+            for document in documents
+        }
+        for node, digest in zip(nodes, chunk_hashes):
+            indexed[node.ref_doc_id]["chunks"].append(digest)
+        return indexed
+
+    def _prune_cache(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Drop cached embeddings and splits the indexed files no longer use."""
+        # Manifests written before these hashes were recorded can't tell what is live
+        if not files or not all("chunks" in entry for entry in files.values()):
+            return
+
+        live = {digest for entry in files.values() for digest in entry["chunks"]}
+        with EmbeddingCache(self.storage_dir / "embeddings.sqlite") as cache:
+            cache.prune(self._embedding_cache_key(), live)
+            # Splits are keyed by document text hash, which is the files' sha256
+            cache.prune_splits(*self._chunking(), (entry["sha256"] for entry in files.values()))
+
     def refresh_index(self) -> bool:
         """Refresh the index with updated system information."""
+        from llama_index.core import Settings
+
         try:
             print("🔄 Refreshing index with latest system information...")
-            self.index = self._create_new_index()
+            if self.index and not self._index_outdated():
+                if not self._update_index():
+                    print("✅ Index up to date")
+                    return True
+            else:
+                self.index = self._create_new_index()
 
             if not self.index:
                 return False
 
             # Update query engine with new index
             if Settings.llm:
-                self.query_engine = self.index.as_query_engine(llm=Settings.llm)
+                self.query_engine = self._create_query_engine(Settings.llm)
                 print("✅ Index refreshed successfully!")
                 return True
             else:
@@ -176,7 +635,10 @@ class SystemQueryEngine:
             return False
 
     def query(self, question: str) -> Optional[str]:
-        """Query the system information with natural language."""
+        """Query the system information with natural language.
+
+        The answer is printed while it is generated and returned once complete.
+        """
         if not self.query_engine:
             print("❌ Query engine not initialized.")
             return None
@@ -184,17 +646,53 @@ class SystemQueryEngine:
         try:
             print(f"🤔 Thinking about: {question}")
             response = self.query_engine.query(question)
-            return str(response)
+
+            print("\n💡 ", end="", flush=True)
+            tokens = []
+            for token in response.response_gen:
+                print(token, end="", flush=True)
+                tokens.append(token)
+            print()
+            return "".join(tokens)
         except Exception as e:
             print(f"❌ Query failed: {e}")
             return None
 
+    def _warm_up(self) -> None:
+        """Ask Ollama to load the model into memory without generating anything."""
+        from llama_index.core import Settings
+
+        llm = Settings.llm
+        try:
+            # An empty prompt only loads the model (and keeps it loaded for keep_alive)
+            llm.client.generate(model=llm.model, prompt="", keep_alive=llm.keep_alive)
+        except Exception:
+            # The first real query will load the model (or report the error) instead
+            pass
+
+    def _serve_queries(self, requests: queue.Queue) -> None:
+        """Answer queued questions one at a time on a background thread."""
+        self._warm_up()
+        while True:
+            request: Optional[Tuple[str, queue.Queue]] = requests.get()
+            if request is None:
+                return
+            question, replies = request
+            replies.put(self.query(question))
+
     def interactive_session(self):
         """Start an interactive query session."""
         print("\n🎯 Welcome to ShellAI System Query!")
         print("Ask questions about your system in natural language.")
         print("Type 'exit', 'quit', or 'q' to stop.\n")
 
+        # Answers to questions already asked in this session
+        answers: Dict[str, str] = {}
+
+        # The worker loads the model while the first question is being typed
+        requests: queue.Queue = queue.Queue()
+        threading.Thread(target=self._serve_queries, args=(requests,), daemon=True).start()
+
         while True:
             try:
                 question = input("❓ Ask about your system: ").strip()
@@ -206,9 +704,20 @@ class SystemQueryEngine:
                 if not question:
                     continue
 
-                response = self.query(question)
+                response = answers.get(question)
+                if response is None:
+                    replies: queue.Queue = queue.Queue(maxsize=1)
+                    requests.put((question, replies))
+                    response = replies.get()
+                    if response:
+                        if len(answers) >= ANSWER_CACHE_SIZE:
+                            answers.pop(next(iter(answers)))
+                        answers[question] = response
+                else:
+                    print(f"\n💡 {response}")
+
                 if response:
-                    print(f"\n💡 {response}\n")
+                    print()
                     print("-" * 50)
 
             except KeyboardInterrupt:
@@ -218,6 +727,8 @@ class SystemQueryEngine:
                 print("\n👋 Goodbye!")
                 break
 
+        requests.put(None)
+
 
 def main():
     """Main function for the interactive query system."""
@@ -241,9 +752,7 @@ def main():
 
     # Single question mode
     if args.question:
-        response = engine.query(args.question)
-        if response:
-            print(f"\n💡 {response}")
+        engine.query(args.question)
         sys.exit(0)
 
     # Interactive mode
@@ -5,70 +5,153 @@ This module gathers various system information that can be queried
 using natural language through the LLM-powered ask interface.
 """
 
+from __future__ import annotations
+
+import os
+import shlex
 import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+
+# A command is either an argument tuple run without a shell, or a function producing the output
+Command = tuple[str, ...] | Callable[[], str | None]
+
+
+def _top_processes() -> str | None:
+    """ps aux --sort=-%cpu | head -20"""
+    output = SystemInfoCollector.run_command(("ps", "aux", "--sort=-%cpu"))
+    if output is None:
+        return None
+    return "".join(output.splitlines(keepends=True)[:20])
+
+
+def _environment() -> str:
+    """env | sort"""
+    return "".join(f"{line}\n" for line in sorted(f"{k}={v}" for k, v in os.environ.items()))
 
 
 class SystemInfoCollector:
     """Collects and stores system information for LLM querying."""
 
+    __slots__ = ("output_dir",)
+
+    HEADER_SEP = "=" * 50
+
+    # System commands to collect information, shared by all instances
+    COMMANDS: dict[str, Command] = {
+        "os.txt": ("uname", "-a"),
+        "disk.txt": ("df", "-h"),
+        "memory.txt": ("free", "-m"),
+        "processes.txt": _top_processes,
+        "network.txt": ("ip", "addr", "show"),
+        "uptime.txt": ("uptime",),
+        "cpu.txt": ("lscpu",),
+        "mount.txt": ("mount",),
+        "users.txt": ("who",),
+        "environment.txt": _environment,
+    }
+
     def __init__(self, output_dir: str = "system_info"):
         """Initialize the collector with an output directory."""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Define system commands to collect information
-        self.commands = {
-            "os.txt": "uname -a",
-            "disk.txt": "df -h",
-            "memory.txt": "free -m",
-            "processes.txt": "ps aux --sort=-%cpu | head -20",
-            "network.txt": "ip addr show",
-            "uptime.txt": "uptime",
-            "cpu.txt": "lscpu",
-            "mount.txt": "mount",
-            "users.txt": "who",
-            "environment.txt": "env | sort",
-        }
-
-    def run_command(self, command: str) -> Optional[str]:
-        """Safely run a system command and return its output."""
+    @staticmethod
+    def describe(command: str | Command) -> str:
+        """Get a printable form of a command."""
+        if isinstance(command, str):
+            return command
+        if callable(command):
+            return (command.__doc__ or command.__name__).strip()
+        return shlex.join(command)
+
+    @staticmethod
+    def run_command(command: str | Sequence[str]) -> str | None:
+        """Safely run a system command and return its output.
+
+        Argument sequences are executed directly; strings are run through the shell.
+        """
         try:
             result = subprocess.run(
                 command,
-                shell=True,
+                shell=isinstance(command, str),
                 capture_output=True,
                 text=True,
                 timeout=30,
                 check=False,
             )
             return result.stdout if result.returncode == 0 else None
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            print(f"Command failed: {command} - {e}")
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            print(f"Command failed: {SystemInfoCollector.describe(command)} - {e}")
             return None
 
-    def collect_all(self) -> Dict[str, bool]:
-        """Collect all system information and save to files."""
-        results: Dict[str, bool] = {}
-
-        print("🔍 Collecting system information...")
-
-        for filename, cmd in self.commands.items():
-            print(f"  📋 Running: {cmd}")
-            output = self.run_command(cmd)
+    def _run(self, command: Command) -> str | None:
+        """Produce the output of a collection command."""
+        if callable(command):
+            return command()
+        return self.run_command(command)
+
+    def collect_all(self, min_age_seconds: float = 0) -> dict[str, bool]:
+        """Collect all system information and save to files.
+
+        Files written less than ``min_age_seconds`` ago are kept as they are instead of
+        being collected again. The default of 0 always collects everything.
+        """
+        results: dict[str, bool] = {}
+        fresh: set[str] = set()
+
+        if min_age_seconds > 0:
+            now = time.time()
+            for filename in self.COMMANDS:
+                try:
+                    mtime = (self.output_dir / filename).stat().st_mtime
+                except OSError:
+                    continue
+                if now - mtime < min_age_seconds:
+                    fresh.add(filename)
+                    results[filename] = True
+
+        commands = {
+            filename: cmd for filename, cmd in self.COMMANDS.items() if filename not in fresh
+        }
 
-            if output:
-                file_path = self.output_dir / filename
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(f"Command: {cmd}\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(output)
-                results[filename] = True
-                print(f"  ✅ Saved: {filename}")
+        # Progress is written in two batches (before and after the run) instead of per line
+        lines = ["🔍 Collecting system information..."]
+        lines.extend(f"  📋 Running: {self.describe(cmd)}" for cmd in commands.values())
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+        # The commands are independent and mostly wait on I/O, so run them concurrently
+        max_workers = max(1, min(len(commands), os.cpu_count() or 8))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._run, cmd): filename for filename, cmd in commands.items()
+            }
+            for future in as_completed(futures):
+                filename = futures[future]
+                output = future.result()
+
+                if output:
+                    header = f"Command: {self.describe(self.COMMANDS[filename])}"
+                    payload = f"{header}\n{self.HEADER_SEP}\n{output}"
+                    (self.output_dir / filename).write_bytes(payload.encode("utf-8"))
+                    results[filename] = True
+                else:
+                    results[filename] = False
+
+        # Report in command order once everything has finished
+        lines = []
+        for filename in self.COMMANDS:
+            if filename in fresh:
+                lines.append(f"  ⏭️  Up to date: {filename}")
+            elif results[filename]:
+                lines.append(f"  ✅ Saved: {filename}")
             else:
-                results[filename] = False
-                print(f"  ❌ Failed: {filename}")
+                lines.append(f"  ❌ Failed: {filename}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return results
 
@@ -78,11 +161,8 @@ class SystemInfoCollector:
         output = self.run_command(command)
 
         if output:
-            file_path = self.output_dir / f"{name}.txt"
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"Custom Command: {command}\n")
-                f.write("=" * 50 + "\n")
-                f.write(output)
+            payload = f"Custom Command: {command}\n{self.HEADER_SEP}\n{output}"
+            (self.output_dir / f"{name}.txt").write_bytes(payload.encode("utf-8"))
             print(f"✅ Saved custom info: {name}.txt")
             return True
         else:
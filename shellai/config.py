@@ -5,59 +5,174 @@ This module handles loading and managing configuration from config.yaml
 and provides default values for all settings.
 """
 
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any
+
+# PyYAML is imported on first use so commands that never touch the config file skip it
+_yaml: Any = None
+
+
+def _get_yaml() -> Any:
+    """Import PyYAML on first use."""
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            print("❌ Error: PyYAML not installed.")
+            print("Run: pip install pyyaml")
+            import sys
+
+            sys.exit(1)
+        _yaml = yaml
+    return _yaml
+
+
+def _yaml_load(stream: Any) -> Any:
+    """Parse YAML safely, using the libyaml-backed loader when available."""
+    yaml = _get_yaml()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
 
-try:
-    import yaml
-except ImportError:
-    print("❌ Error: PyYAML not installed.")
-    print("Run: pip install pyyaml")
-    import sys
 
-    sys.exit(1)
+def _yaml_dump(data: Any, stream: Any) -> None:
+    """Write YAML safely, using the libyaml-backed dumper when available."""
+    yaml = _get_yaml()
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, indent=2)
+
+
+def _has_str_keys(value: Any) -> bool:
+    """Check that every mapping nested in a parsed YAML value only has string keys."""
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _has_str_keys(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_has_str_keys(item) for item in value)
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _split_path(key_path: str) -> tuple[str, ...]:
+    """Split a dot-notation key path into its keys."""
+    return tuple(key_path.split("."))
 
 
 class ShellAIConfig:
     """Configuration manager for ShellAI."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    _CACHED_PROPERTIES = (
+        "ollama_base_url",
+        "default_model",
+        "embedding_model",
+        "system_info_dir",
+        "storage_dir",
+    )
+
+    def __init__(self, config_path: str | None = None):
         """Initialize configuration manager."""
         self.config_path = Path(config_path) if config_path else Path("config.yaml")
-        self._config: Dict[str, Any] = {}
+        self._config: dict[str, Any] = {}
         self._load_config()
 
-    def _get_default_config(self) -> Dict[str, Any]:
+    def _get_default_config(self) -> dict[str, Any]:
         """Get default configuration values."""
         return {
             "ollama": {
                 "base_url": "http://localhost:11434",
                 "default_model": "gemma2:2b",
                 "request_timeout": 60.0,
+                "keep_alive": "30m",
+            },
+            "embedding": {"model": "fastembed:BAAI/bge-small-en-v1.5", "batch_size": 64},
+            "index": {
+                "chunk_size": 1024,
+                "chunk_overlap": 50,
+                "insert_batch_size": 2048,
+                "vector_store": "auto",
+                "chroma_threshold": 200,
             },
-            "embedding": {"model": "local:BAAI/bge-small-en"},
+            "ingest": {"num_workers": 0, "parallel_threshold": 32},
             "system_info": {"output_dir": "system_info", "storage_dir": "storage"},
         }
 
     def _load_config(self) -> None:
-        """Load configuration from file or create default."""
+        """Load configuration from file, falling back to the defaults."""
         # Start with defaults
         self._config = self._get_default_config()
+        self._from_defaults = not self.config_path.exists()
 
-        if self.config_path.exists():
+        if not self._from_defaults:
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    user_config = yaml.safe_load(f) or {}
+                user_config = self._read_config_file()
                 # Merge user config with defaults
                 self._merge_config(self._config, user_config)
             except Exception as e:
                 print(f"⚠️ Warning: Failed to load config from {self.config_path}: {e}")
                 print("Using default configuration.")
-        else:
-            # Create default config file
-            self.create_default_config()
+        # A missing file is not created here; save() writes it once something is changed
+
+    def _parse_cache_path(self) -> Path:
+        """Get the file caching the parsed contents of this config file.
+
+        It lives in the user's own cache directory, never in the shared temp directory.
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        key = hashlib.blake2b(str(self.config_path.resolve()).encode(), digest_size=8)
+        return Path(cache_home) / "shellai" / f"config-{key.hexdigest()}.json"
 
-    def _merge_config(self, default: Dict[str, Any], user: Dict[str, Any]) -> None:
+    def _read_config_file(self) -> dict[str, Any]:
+        """Parse the config file, reusing the cached parse while its mtime and size match."""
+        stat = self.config_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+
+        try:
+            cache_path: Path | None = self._parse_cache_path()
+        except (OSError, RuntimeError, KeyError):
+            # No usable home directory (e.g. HOME unset); parse without caching
+            cache_path = None
+
+        if cache_path is not None:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                if cached.get("stamp") == stamp and isinstance(cached.get("config"), dict):
+                    return cached["config"]
+            except (OSError, ValueError, AttributeError):
+                pass
+
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            user_config = _yaml_load(f) or {}
+
+        # JSON would turn non-string keys into strings, so such configs aren't cached
+        if cache_path is None or not _has_str_keys(user_config):
+            return user_config
+
+        tmp_path = None
+        try:
+            payload = json.dumps({"stamp": stamp, "config": user_config})
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Caching is best effort, e.g. values JSON can't represent
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        return user_config
+
+    def _merge_config(self, default: dict[str, Any], user: dict[str, Any]) -> None:
         """Recursively merge user config into default config."""
         for key, value in user.items():
             if key in default and isinstance(default[key], dict) and isinstance(value, dict):
@@ -69,14 +184,14 @@ class ShellAIConfig:
         """Create a default configuration file."""
         try:
             with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2)
+                _yaml_dump(self._config, f)
             print(f"📝 Created default configuration file: {self.config_path}")
         except Exception as e:
             print(f"⚠️ Warning: Failed to create config file: {e}")
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'ollama.base_url')."""
-        keys = key_path.split(".")
+        keys = _split_path(key_path)
         value = self._config
 
         for key in keys:
@@ -89,7 +204,7 @@ class ShellAIConfig:
 
     def set(self, key_path: str, value: Any) -> None:
         """Set configuration value using dot notation."""
-        keys = key_path.split(".")
+        keys = _split_path(key_path)
         config = self._config
 
         # Navigate to the parent of the target key
@@ -100,12 +215,14 @@ class ShellAIConfig:
 
         # Set the final value
         config[keys[-1]] = value
+        self._from_defaults = False
+        self._clear_cached_properties()
 
     def save(self) -> bool:
         """Save current configuration to file."""
         try:
             with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2)
+                _yaml_dump(self._config, f)
             return True
         except Exception as e:
             print(f"❌ Failed to save config: {e}")
@@ -114,47 +231,55 @@ class ShellAIConfig:
     def reload(self) -> None:
         """Reload configuration from file."""
         self._load_config()
+        self._clear_cached_properties()
+
+    def _clear_cached_properties(self) -> None:
+        """Forget cached property values so they are looked up again."""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     @property
+    def using_defaults(self) -> bool:
+        """Whether the configuration comes purely from defaults, with no config file."""
+        return self._from_defaults
+
+    @functools.cached_property
     def ollama_base_url(self) -> str:
         """Get Ollama base URL."""
         return self.get("ollama.base_url", "http://localhost:11434")
 
-    @property
+    @functools.cached_property
     def default_model(self) -> str:
         """Get default Ollama model."""
         return self.get("ollama.default_model", "mistral")
 
-    @property
+    @functools.cached_property
     def embedding_model(self) -> str:
         """Get embedding model."""
-        return self.get("embedding.model", "local:BAAI/bge-small-en")
+        return self.get("embedding.model", "fastembed:BAAI/bge-small-en-v1.5")
 
-    @property
+    @functools.cached_property
     def system_info_dir(self) -> str:
         """Get system info directory."""
         return self.get("system_info.output_dir", "system_info")
 
-    @property
+    @functools.cached_property
     def storage_dir(self) -> str:
         """Get storage directory name."""
         return self.get("system_info.storage_dir", "storage")
 
 
-# Global config instance
-_config: Optional[ShellAIConfig] = None
+# Config instances, one per config file path
+_config_cache: dict[str | None, ShellAIConfig] = {}
 
 
-def get_config(config_path: Optional[str] = None) -> ShellAIConfig:
-    """Get the global configuration instance."""
-    global _config
-    if _config is None or config_path:
-        _config = ShellAIConfig(config_path)
-    return _config
+def get_config(config_path: str | None = None) -> ShellAIConfig:
+    """Get the configuration instance for a config file path."""
+    if config_path not in _config_cache:
+        _config_cache[config_path] = ShellAIConfig(config_path)
+    return _config_cache[config_path]
 
 
 def reload_config() -> None:
-    """Reload the global configuration."""
-    global _config
-    if _config:
-        _config.reload()
+    """Drop the loaded configurations so they are read again on next use."""
+    _config_cache.clear()
@@ -0,0 +1,145 @@
+"""
+Persistent embedding cache for ShellAI.
+
+Embeddings are stored in a small SQLite database keyed by the embedding
+model name and the SHA-256 of the embedded text, so text that has already
+been embedded never has to go through the model again. The same database
+remembers how documents were split into chunks, so unchanged documents
+skip sentence splitting and tokenization as well.
+"""
+
+import hashlib
+import json
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# SQLite limits the number of bound parameters per statement
+_MAX_VARIABLES = 500
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embedding vectors."""
+
+    def __init__(self, path: Path):
+        """Open (or create) the cache database at the given path."""
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, hash))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS splits ("
+            "hash TEXT NOT NULL, chunk_size INTEGER NOT NULL, chunk_overlap INTEGER NOT NULL, "
+            "chunks TEXT NOT NULL, PRIMARY KEY (hash, chunk_size, chunk_overlap))"
+        )
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Look up cached vectors, returning only the hashes that were found."""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+
+        for start in range(0, len(unique), _MAX_VARIABLES):
+            chunk = unique[start : start + _MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                (model, *chunk),
+            )
+            for digest, blob in rows:
+                vector = array("d")
+                vector.frombytes(blob)
+                found[digest] = vector.tolist()
+
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, Sequence[float]]]) -> None:
+        """Store vectors for the given hashes in a single transaction."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)",
+                ((model, digest, array("d", vector).tobytes()) for digest, vector in items),
+            )
+
+    def _fill_keep(self, keep: Iterable[str]) -> None:
+        """Load the hashes to keep into a temporary table for NOT IN lookups."""
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep (hash TEXT PRIMARY KEY)")
+        self._conn.execute("DELETE FROM keep")
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO keep (hash) VALUES (?)", ((digest,) for digest in keep)
+        )
+
+    def prune(self, model: str, keep: Iterable[str]) -> int:
+        """Delete the model's vectors whose hash is not in keep, returning how many went."""
+        with self._conn:
+            self._fill_keep(keep)
+            deleted = self._conn.execute(
+                "DELETE FROM embeddings WHERE model = ? AND hash NOT IN (SELECT hash FROM keep)",
+                (model,),
+            ).rowcount
+            self._conn.execute("DELETE FROM keep")
+        return deleted
+
+    def get_splits(
+        self, chunk_size: int, chunk_overlap: int, hashes: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        """Look up cached chunk texts for documents, keyed by document text hash."""
+        found: Dict[str, List[str]] = {}
+        unique = list(dict.fromkeys(hashes))
+
+        for start in range(0, len(unique), _MAX_VARIABLES):
+            chunk = unique[start : start + _MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT hash, chunks FROM splits WHERE chunk_size = ? AND chunk_overlap = ? "
+                f"AND hash IN ({placeholders})",
+                (chunk_size, chunk_overlap, *chunk),
+            )
+            for digest, chunks in rows:
+                found[digest] = json.loads(chunks)
+
+        return found
+
+    def put_splits(
+        self, chunk_size: int, chunk_overlap: int, items: Iterable[Tuple[str, List[str]]]
+    ) -> None:
+        """Store the chunk texts of documents in a single transaction."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO splits (hash, chunk_size, chunk_overlap, chunks) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (digest, chunk_size, chunk_overlap, json.dumps(chunks))
+                    for digest, chunks in items
+                ),
+            )
+
+    def prune_splits(self, chunk_size: int, chunk_overlap: int, keep: Iterable[str]) -> int:
+        """Delete splits made with other chunking, or whose hash is not in keep."""
+        with self._conn:
+            self._fill_keep(keep)
+            deleted = self._conn.execute(
+                "DELETE FROM splits WHERE chunk_size != ? OR chunk_overlap != ? "
+                "OR hash NOT IN (SELECT hash FROM keep)",
+                (chunk_size, chunk_overlap),
+            ).rowcount
+            self._conn.execute("DELETE FROM keep")
+        return deleted
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,67 @@
+"""
+Embedding model adapters for ShellAI.
+
+This module provides an Ollama embedding model that sends whole batches of
+texts to Ollama's native ``/api/embed`` endpoint instead of issuing one HTTP
+request per chunk.
+"""
+
+from typing import Any, Dict, List
+
+import httpx
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+
+
+class OllamaBatchEmbedding(BaseEmbedding):
+    """Ollama embeddings using the batch ``/api/embed`` endpoint."""
+
+    base_url: str = Field(default="http://localhost:11434", description="Ollama server URL")
+    request_timeout: float = Field(default=60.0, description="HTTP timeout in seconds")
+
+    _client: httpx.Client = PrivateAttr()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Reuse one keep-alive connection for every batch instead of reconnecting
+        self._client = httpx.Client(base_url=self.base_url, timeout=self.request_timeout)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "OllamaBatchEmbedding"
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._client.post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def _apost(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
+            response = await client.post(f"{self.base_url.rstrip('/')}{path}", json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """Embed a whole batch of texts with a single request."""
+        return self._post("/api/embed", {"model": self.model_name, "input": texts})["embeddings"]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """Embed a whole batch of texts with a single request."""
+        result = await self._apost("/api/embed", {"model": self.model_name, "input": texts})
+        return result["embeddings"]
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return (await self._aget_text_embeddings([text]))[0]
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        # Single queries stay on the legacy endpoint, which older servers also support
+        return self._post("/api/embeddings", {"model": self.model_name, "prompt": query})[
+            "embedding"
+        ]
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        result = await self._apost("/api/embeddings", {"model": self.model_name, "prompt": query})
+        return result["embedding"]